@@ -2,7 +2,7 @@
 
 # HSSearch Data Import Script
 # Handles all data import and database operations
-# Usage: ./import-data.sh [--status|--force|--help]
+# Usage: ./import-data.sh [--status|--force|--yes|--help]
 
 set -e
 
@@ -28,17 +28,20 @@ show_help() {
     echo "Options:"
     echo "  --status    Check current data status"
     echo "  --force     Force reimport even if data exists"
+    echo "  --yes       Skip the confirmation prompt (non-interactive runs)"
     echo "  --help      Show this help message"
     echo ""
     echo "Examples:"
     echo "  $0              # Import data (skip if exists)"
     echo "  $0 --status     # Check data status"
     echo "  $0 --force      # Force reimport data"
+    echo "  $0 --force --yes # Force reimport without prompting"
 }
 
 # Parse command line arguments
 FORCE_IMPORT=false
 STATUS_ONLY=false
+ASSUME_YES=false
 
 while [[ $# -gt 0 ]]; do
     case $1 in
@@ -50,6 +53,10 @@ while [[ $# -gt 0 ]]; do
             STATUS_ONLY=true
             shift
             ;;
+        --yes|-y)
+            ASSUME_YES=true
+            shift
+            ;;
         --help)
             show_help
             exit 0
@@ -109,16 +116,16 @@ get_data_status() {
         return 1
     fi
     
-    # Get record count
-    record_count=$(docker compose exec -T postgres psql -U hsearch_user -d hsearch_db -t -c "SELECT COUNT(*) FROM hs_codes;" 2>/dev/null | tr -d ' \n' || echo "0")
+    # Get record and Indonesian translation counts in a single table scan
+    counts=$(docker compose exec -T postgres psql -U hsearch_user -d hsearch_db -t -A -F ' ' -c "SELECT COUNT(*), COUNT(*) FILTER (WHERE description_id IS NOT NULL AND description_id != '') FROM hs_codes;" 2>/dev/null || echo "0 0")
+    read -r record_count indonesian_count <<< "$counts"
+    record_count=${record_count:-0}
+    indonesian_count=${indonesian_count:-0}
     
     echo "  • Table Status: ✅ Exists"
     echo "  • Record Count: $record_count"
     
     if [ "$record_count" -gt 0 ]; then
-        # Check Indonesian translations
-        indonesian_count=$(docker compose exec -T postgres psql -U hsearch_user -d hsearch_db -t -c "SELECT COUNT(*) FROM hs_codes WHERE description_id IS NOT NULL AND description_id != '';" 2>/dev/null | tr -d ' \n' || echo "0")
-        
         echo "  • Indonesian Translations: $indonesian_count"
         
         if [ "$indonesian_count" -gt 0 ]; then
@@ -247,7 +254,7 @@ main() {
     check_data_file
     
     # Ask for confirmation if forcing reimport
-    if [ "$FORCE_IMPORT" = true ]; then
+    if [ "$FORCE_IMPORT" = true ] && [ "$ASSUME_YES" = false ]; then
         echo ""
         print_warning "⚠️  FORCE REIMPORT REQUESTED"
         print_warning "This will replace all existing data!"
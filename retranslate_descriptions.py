@@ -4,9 +4,22 @@ Re-translate all description_id entries from description_en to ensure
 complete and consistent Indonesian translations.
 """
 
+import re
 import pandas as pd
 import sys
 
+# Words whose translation depends on word order, handled by the word-order patterns
+ORDER_SENSITIVE_WORDS = {'live', 'male', 'female', 'pure-bred', 'breeding', 'weighing'}
+
+WHITESPACE_RE = re.compile(r'\s+')
+
+# Move adjectives after the noun they describe
+GRAMMAR_FIXES = [
+    (re.compile(r'\bhidup\s+(kuda|sapi|kerbau|keledai|bagal|babi|domba|kambing)'), r'\1 hidup'),
+    (re.compile(r'\bjantan\s+(sapi|kerbau|kuda|kambing|domba)'), r'\1 jantan'),
+    (re.compile(r'\bbetina\s+(sapi|kerbau|kuda|kambing|domba)'), r'\1 betina'),
+]
+
 def create_comprehensive_translation_dict():
     """Create comprehensive English to Indonesian translation dictionary for HS codes"""
     return {
@@ -128,17 +141,8 @@ def create_comprehensive_translation_dict():
         "other than": "selain",
     }
 
-def translate_text(text, translation_dict):
-    """Translate English text to Indonesian using dictionary with proper word order"""
-    if pd.isna(text) or text.strip() == '':
-        return text
-    
-    import re
-    
-    # Convert to string and clean
-    original = str(text).strip().lower()
-    translated = original
-    
+def compile_translation_patterns(translation_dict):
+    """Precompile the word-order patterns and a single longest-first alternation over the dictionary"""
     # Handle specific patterns with correct Indonesian word order
     patterns = [
         # Fix "live + animal" to "animal + hidup" - more comprehensive
@@ -169,35 +173,44 @@ def translate_text(text, translation_dict):
         (r'^\blive\s+',
          ""),
     ]
+    compiled_patterns = [(re.compile(pattern, re.IGNORECASE), replacement) for pattern, replacement in patterns]
+    
+    # Longest entries first so multi-word phrases win over their parts
+    words = sorted((english for english in translation_dict if english not in ORDER_SENSITIVE_WORDS),
+                   key=len, reverse=True)
+    word_pattern = re.compile(r'\b(?:' + '|'.join(re.escape(english) for english in words) + r')\b',
+                              re.IGNORECASE)
+    
+    return compiled_patterns, word_pattern
+
+def translate_text(text, translation_dict, compiled_patterns):
+    """Translate English text to Indonesian using dictionary with proper word order
+    
+    compiled_patterns is the result of compile_translation_patterns(translation_dict).
+    """
+    if pd.isna(text) or text.strip() == '':
+        return text
+    
+    patterns, word_pattern = compiled_patterns
+    
+    # Convert to string and clean
+    original = str(text).strip().lower()
+    translated = original
     
     # Apply pattern-based translations first
     for pattern, replacement in patterns:
-        if callable(replacement):
-            translated = re.sub(pattern, replacement, translated, flags=re.IGNORECASE)
-        else:
-            translated = re.sub(pattern, replacement, translated, flags=re.IGNORECASE)
-    
-    # Sort by length (longest first) to avoid partial replacements
-    sorted_translations = sorted(translation_dict.items(), key=lambda x: len(x[0]), reverse=True)
+        translated = pattern.sub(replacement, translated)
     
-    # Apply remaining word-by-word translations
-    for english, indonesian in sorted_translations:
-        # Skip if already handled by patterns above
-        if english in ['live', 'male', 'female', 'pure-bred', 'breeding', 'weighing']:
-            continue
-            
-        # Case insensitive replacement with word boundaries
-        pattern = r'\b' + re.escape(english) + r'\b'
-        translated = re.sub(pattern, indonesian, translated, flags=re.IGNORECASE)
+    # Apply remaining word-by-word translations in one pass
+    translated = word_pattern.sub(lambda m: translation_dict[m.group(0).lower()], translated)
     
     # Clean up extra spaces and formatting
-    translated = re.sub(r'\s+', ' ', translated).strip()
+    translated = WHITESPACE_RE.sub(' ', translated).strip()
     translated = translated.replace(' ,', ',').replace(' ;', ';')
     
     # Fix common Indonesian grammar issues
-    translated = re.sub(r'\bhidup\s+(kuda|sapi|kerbau|keledai|bagal|babi|domba|kambing)', r'\1 hidup', translated)
-    translated = re.sub(r'\bjantan\s+(sapi|kerbau|kuda|kambing|domba)', r'\1 jantan', translated)
-    translated = re.sub(r'\bbetina\s+(sapi|kerbau|kuda|kambing|domba)', r'\1 betina', translated)
+    for pattern, replacement in GRAMMAR_FIXES:
+        translated = pattern.sub(replacement, translated)
     
     return translated
 
@@ -236,26 +249,14 @@ def main():
     # Create translation dictionary
     print("Creating translation dictionary...")
     translation_dict = create_comprehensive_translation_dict()
+    compiled_patterns = compile_translation_patterns(translation_dict)
     print(f"Loaded {len(translation_dict)} translation mappings")
     
     # Re-translate all description_id based on description_en
     print("\nRe-translating all descriptions...")
-    retranslated_count = 0
-    
-    for idx, row in df.iterrows():
-        original_en = row['description_en']
-        original_id = row['description_id']
-        
-        # Translate from English
-        new_translation = translate_text(original_en, translation_dict)
-        
-        # Update the description_id
-        df.at[idx, 'description_id'] = new_translation
-        retranslated_count += 1
-        
-        # Show progress every 1000 records
-        if (idx + 1) % 1000 == 0:
-            print(f"  Processed {idx + 1} records...")
+    # Translate every description from English
+    df['description_id'] = df['description_en'].map(lambda text: translate_text(text, translation_dict, compiled_patterns))
+    retranslated_count = len(df)
     
     print(f"Re-translated {retranslated_count} descriptions")
     